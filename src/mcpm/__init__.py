@@ -2,10 +2,17 @@
 MCPM - Model Context Protocol Manager
 """
 
+import importlib
+
 # Import version from internal module
-# Import router module
-from . import router
 from .version import __version__
 
 # Define what symbols are exported from this package
 __all__ = ["__version__", "router"]
+
+
+def __getattr__(name):
+    # Import the router module on first access, it pulls in the whole MCP server stack
+    if name == "router":
+        return importlib.import_module(f"{__name__}.router")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,20 @@
+"""
+Console entry point for MCPM
+
+Answers ``mcpm --version`` using only the standard library and defers
+everything else to the click application in :mod:`mcpm.cli`.
+"""
+
+import sys
+
+
+def main():
+    if len(sys.argv) == 2 and sys.argv[1] in ("-v", "--version"):
+        from mcpm.version import __version__
+
+        print(__version__)
+        return 0
+
+    from mcpm.cli import main as cli_main
+
+    return cli_main()
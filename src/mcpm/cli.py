@@ -2,84 +2,154 @@
 MCPM CLI - Main entry point for the Model Context Protocol Manager CLI
 """
 
+import functools
+import importlib
+import shutil
+
 import click
-from rich.console import Console
-from rich.table import Table
 
 from mcpm import __version__
-from mcpm.clients.client_config import ClientConfigManager
-from mcpm.commands import (
-    add,
-    client,
-    config,
-    info,
-    inspector,
-    list,
-    pop,
-    profile,
-    remove,
-    router,
-    search,
-    stash,
-    transfer,
-)
-
-console = Console()
-client_config_manager = ClientConfigManager()
 
 # Set -h as an alias for --help but we'll handle it ourselves
 CONTEXT_SETTINGS = dict(help_option_names=[])
 
-
-def print_logo():
-    # Create bold ASCII art with thicker characters for a more striking appearance
-    logo = [
-        " ███╗   ███╗ ██████╗██████╗ ███╗   ███╗ ",
-        " ████╗ ████║██╔════╝██╔══██╗████╗ ████║ ",
-        " ██╔████╔██║██║     ██████╔╝██╔████╔██║ ",
-        " ██║╚██╔╝██║██║     ██╔═══╝ ██║╚██╔╝██║ ",
-        " ██║ ╚═╝ ██║╚██████╗██║     ██║ ╚═╝ ██║ ",
-        " ╚═╝     ╚═╝ ╚═════╝╚═╝     ╚═╝     ╚═╝ ",
-        "",
-        f"v{__version__}",
-        "Open Source. Forever Free.",
-        "Built with ❤️ by Path Integral Institute",
+# Subcommands that work without an active client, so the client config is not loaded for them
+_NO_CLIENT_REQUIRED = {"client", "config", "search", "router"}
+
+# Commands shown in the custom help screen, grouped by topic
+HELP_COMMAND_GROUPS = {
+    "client": [
+        ("client", "Manage the active MCPM client."),
+    ],
+    "server": [
+        ("search", "Search available MCP servers."),
+        ("info", "Show detailed information about a specific MCP server."),
+        ("add", "Add an MCP server directly to a client."),
+        ("cp", "Copy a server from one client/profile to another."),
+        ("mv", "Move a server from one client/profile to another."),
+        ("rm", "Remove an installed MCP server."),
+        ("ls", "List all installed MCP servers."),
+        ("stash", "Temporarily store a server configuration aside."),
+        ("pop", "Restore a previously stashed server configuration."),
+    ],
+    "profile": [
+        ("profile", "Manage MCPM profiles."),
+        ("activate", "Activate a profile."),
+        ("deactivate", "Deactivate a profile."),
+    ],
+    "router": [
+        ("router", "Manage MCP router service."),
+    ],
+    "util": [
+        ("config", "Manage MCPM configuration."),
+        ("inspector", "Launch the MCPM Inspector UI to examine servers."),
+    ],
+}
+
+
+def _format_help_commands() -> str:
+    """Lay out the command listing once; column widths are fixed by the command names"""
+    width = max(len(name) for commands in HELP_COMMAND_GROUPS.values() for name, _ in commands)
+    lines = []
+    for group, commands in HELP_COMMAND_GROUPS.items():
+        lines.append(f"[yellow]{group}[/]")
+        lines.extend(f"  [cyan]{name:<{width}}[/]  {desc}" for name, desc in commands)
+    return "\n".join(lines)
+
+
+HELP_COMMANDS = _format_help_commands()
+
+
+# Create bold ASCII art with thicker characters for a more striking appearance
+_LOGO_LINES = [
+    " ███╗   ███╗ ██████╗██████╗ ███╗   ███╗ ",
+    " ████╗ ████║██╔════╝██╔══██╗████╗ ████║ ",
+    " ██╔████╔██║██║     ██████╔╝██╔████╔██║ ",
+    " ██║╚██╔╝██║██║     ██╔═══╝ ██║╚██╔╝██║ ",
+    " ██║ ╚═╝ ██║╚██████╗██║     ██║ ╚═╝ ██║ ",
+    " ╚═╝     ╚═╝ ╚═════╝╚═╝     ╚═╝     ╚═╝ ",
+]
+_TAGLINE1 = "Open Source. Forever Free."
+_TAGLINE2 = "Built with ❤️ by Path Integral Institute"
+
+# Terminal width used for centering, queried once; falls back to the standard 80 columns
+_TERM_WIDTH = shutil.get_terminal_size((80, 24)).columns
+_SEPARATOR = "[bold cyan]" + "=" * _TERM_WIDTH + "[/]"
+# All lines of the ASCII art share the same padding, the taglines are centered on their own
+_BASE_PAD = " " * ((_TERM_WIDTH - len(_LOGO_LINES[0])) // 2)
+_TAG1_PAD = " " * ((_TERM_WIDTH - len(_TAGLINE1)) // 2)
+_TAG2_PAD = " " * ((_TERM_WIDTH - len(_TAGLINE2)) // 2)
+
+# Banner markup, the last line of the art carries the version
+_BANNER_TEMPLATE = "\n".join(
+    [
+        _SEPARATOR,
+        *(f"{_BASE_PAD}[bold green]{line}[/]" for line in _LOGO_LINES[:-1]),
+        f"{_BASE_PAD}[bold green]{_LOGO_LINES[-1]}[/] [bold yellow]v{{version}}[/]",
+        f"{_TAG1_PAD}[bold magenta]{_TAGLINE1}[/]",
+        f"{_TAG2_PAD}[bold cyan]{_TAGLINE2}[/]",
+        _SEPARATOR,
     ]
+)
 
-    # Define terminal width for centering
-    terminal_width = 80  # Standard terminal width
 
-    # Print separator line
-    console.print("[bold cyan]" + "=" * terminal_width + "[/]")
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Create the rich console on first use, keeping rich off the startup path"""
+    from rich.console import Console
 
-    # Calculate base padding for ASCII art
-    base_padding = " " * ((terminal_width - len(logo[0])) // 2)
+    # a fixed width spares rich from probing the terminal size again
+    return Console(width=_TERM_WIDTH)
 
-    # Center the ASCII art (except last line)
-    for i in range(5):  # First 5 lines of the ASCII art
-        console.print(f"{base_padding}[bold green]{logo[i]}[/]")
 
-    # Print last line with version, using the same base padding
-    version_text = f"v{__version__}"
-    console.print(f"{base_padding}[bold green]{logo[5]}[/] [bold yellow]{version_text}[/]")
+@functools.lru_cache(maxsize=1)
+def _client_config_manager():
+    """Load the client config only for commands that look at it, not for --version"""
+    from mcpm.clients.client_config import ClientConfigManager
 
-    # Center the taglines
-    tagline1 = logo[8]  # "Open Source. Forever Free."
-    tagline2 = logo[9]  # "Built with ❤️ by Path Integral Institute"
+    return ClientConfigManager()
 
-    # Calculate center padding for each tagline
-    tagline1_padding = " " * ((terminal_width - len(tagline1)) // 2)
-    tagline2_padding = " " * ((terminal_width - len(tagline2)) // 2)
 
-    # Print centered taglines
-    console.print(tagline1_padding + "[bold magenta]" + tagline1 + "[/]")
-    console.print(tagline2_padding + "[bold cyan]" + tagline2 + "[/]")
+@functools.lru_cache(maxsize=1)
+def _client_registry():
+    """Import the client registry, and with it every client manager, on first use"""
+    from mcpm.clients.client_registry import ClientRegistry
+
+    return ClientRegistry
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are dispatched.
+
+    Subcommands are declared in ``lazy_subcommands`` as a mapping of
+    CLI name -> (module path, attribute name).
+    """
 
-    # Print separator line
-    console.print("[bold cyan]" + "=" * terminal_width + "[/]")
+    lazy_subcommands: dict[str, tuple[str, str]] = {}
 
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
 
-@click.group(context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_path, attr = self.lazy_subcommands[cmd_name]
+            return getattr(importlib.import_module(module_path), attr)
+        return super().get_command(ctx, cmd_name)
+
+
+@functools.lru_cache(maxsize=1)
+def _logo():
+    """Parse the banner markup once; its content only depends on the version"""
+    from rich.text import Text
+
+    return Text.from_markup(_BANNER_TEMPLATE.format(version=__version__))
+
+
+def print_logo():
+    _console().print(_logo())
+
+
+@click.group(cls=LazyGroup, context_settings=CONTEXT_SETTINGS, invoke_without_command=True)
 @click.option("-h", "--help", "help_flag", is_flag=True, help="Show this message and exit.")
 @click.option("-v", "--version", is_flag=True, help="Show version and exit.")
 @click.pass_context
@@ -92,19 +162,18 @@ def main(ctx, help_flag, version):
         print_logo()
         return
 
-    # Check if a command is being executed (and it's not help, no command, or the client command)
-    if ctx.invoked_subcommand and ctx.invoked_subcommand != "client" and not help_flag:
+    # Check if a command is being executed (and it's not help, no command, or one that needs no client)
+    if ctx.invoked_subcommand and ctx.invoked_subcommand not in _NO_CLIENT_REQUIRED and not help_flag:
         # Check if active client is set
-        active_client = client_config_manager.get_active_client()
+        active_client = _client_config_manager().get_active_client()
         if not active_client:
+            console = _console()
             console.print("[bold red]Error:[/] No active client set.")
             console.print("Please run 'mcpm client set <client-name>' to set an active client.")
             console.print("Available clients:")
 
             # Show available clients
-            from mcpm.clients.client_registry import ClientRegistry
-
-            for client in ClientRegistry.get_supported_clients():
+            for client in _client_registry().get_supported_clients():
                 console.print(f"  - {client}")
 
             # Exit with error
@@ -112,88 +181,68 @@ def main(ctx, help_flag, version):
     # If no command was invoked or help is requested, show our custom help
     if ctx.invoked_subcommand is None or help_flag:
         # Get active client
-        active_client = client_config_manager.get_active_client()
+        active_client = _client_config_manager().get_active_client()
 
-        print_logo()
         # Get information about installed clients
-        from mcpm.clients.client_registry import ClientRegistry
-
-        installed_clients = ClientRegistry.detect_installed_clients()
-
-        # Display active client information and main help
-        if active_client:
-            client_status = "[green]✓[/]" if installed_clients.get(active_client, False) else "[yellow]⚠[/]"
-            console.print(f"[bold magenta]Active client:[/] [yellow]{active_client}[/] {client_status}")
-        else:
-            console.print("[bold red]No active client set![/] Please run 'mcpm client set <client-name>' to set one.")
-        console.print("")
-
-        # Display usage info
-        console.print("[bold green]Usage:[/] [white]mcpm [OPTIONS] COMMAND [ARGS]...[/]")
-        console.print("")
-        console.print("[bold green]Description:[/] [white]A tool for managing MCP servers across various clients.[/]")
-        console.print("")
-
-        # Display options
-        console.print("[bold]Options:[/]")
-        console.print("  --version   Show the version and exit.")
-        console.print("  -h, --help  Show this message and exit.")
-        console.print("")
-
-        # Display available commands in a table
-        console.print("[bold]Commands:[/]")
-        commands_table = Table(show_header=False, box=None, padding=(0, 2, 0, 0))
-        commands_table.add_row("[yellow]client[/]")
-        commands_table.add_row("  [cyan]client[/]", "Manage the active MCPM client.")
-
-        commands_table.add_row("[yellow]server[/]")
-        commands_table.add_row("  [cyan]search[/]", "Search available MCP servers.")
-        commands_table.add_row("  [cyan]info[/]", "Show detailed information about a specific MCP server.")
-        commands_table.add_row("  [cyan]add[/]", "Add an MCP server directly to a client.")
-        commands_table.add_row("  [cyan]cp[/]", "Copy a server from one client/profile to another.")
-        commands_table.add_row("  [cyan]mv[/]", "Move a server from one client/profile to another.")
-        commands_table.add_row("  [cyan]rm[/]", "Remove an installed MCP server.")
-        commands_table.add_row("  [cyan]ls[/]", "List all installed MCP servers.")
-        commands_table.add_row("  [cyan]stash[/]", "Temporarily store a server configuration aside.")
-        commands_table.add_row("  [cyan]pop[/]", "Restore a previously stashed server configuration.")
-
-        commands_table.add_row("[yellow]profile[/]")
-        commands_table.add_row("  [cyan]profile[/]", "Manage MCPM profiles.")
-        commands_table.add_row("  [cyan]activate[/]", "Activate a profile.")
-        commands_table.add_row("  [cyan]deactivate[/]", "Deactivate a profile.")
-
-        commands_table.add_row("[yellow]router[/]")
-        commands_table.add_row("  [cyan]router[/]", "Manage MCP router service.")
-
-        commands_table.add_row("[yellow]util[/]")
-        commands_table.add_row("  [cyan]config[/]", "Manage MCPM configuration.")
-        commands_table.add_row("  [cyan]inspector[/]", "Launch the MCPM Inspector UI to examine servers.")
-        console.print(commands_table)
-
-        # Additional helpful information
-        console.print("")
-        console.print("[italic]Run [bold]mcpm COMMAND -h[/] for more information on a command.[/]")
-
-
-# Register commands
-main.add_command(search.search)
-main.add_command(info.info)
-main.add_command(remove.remove, name="rm")
-main.add_command(add.add)
-main.add_command(list.list, name="ls")
-
-main.add_command(stash.stash)
-main.add_command(pop.pop)
-
-main.add_command(client.client)
-main.add_command(config.config)
-main.add_command(inspector.inspector, name="inspector")
-main.add_command(profile.profile, name="profile")
-main.add_command(transfer.move, name="mv")
-main.add_command(transfer.copy, name="cp")
-main.add_command(profile.activate)
-main.add_command(profile.deactivate)
-main.add_command(router.router, name="router")
+        installed_clients = _client_registry().detect_installed_clients()
+
+        # Buffer the whole help screen and flush it to the terminal in a single write
+        console = _console()
+        with console:
+            print_logo()
+
+            # Display active client information and main help
+            if active_client:
+                client_status = "[green]✓[/]" if installed_clients.get(active_client, False) else "[yellow]⚠[/]"
+                console.print(f"[bold magenta]Active client:[/] [yellow]{active_client}[/] {client_status}")
+            else:
+                console.print(
+                    "[bold red]No active client set![/] Please run 'mcpm client set <client-name>' to set one."
+                )
+            console.print("")
+
+            # Display usage info
+            console.print("[bold green]Usage:[/] [white]mcpm [OPTIONS] COMMAND [ARGS]...[/]")
+            console.print("")
+            console.print(
+                "[bold green]Description:[/] [white]A tool for managing MCP servers across various clients.[/]"
+            )
+            console.print("")
+
+            # Display options
+            console.print("[bold]Options:[/]")
+            console.print("  --version   Show the version and exit.")
+            console.print("  -h, --help  Show this message and exit.")
+            console.print("")
+
+            # Display available commands
+            console.print("[bold]Commands:[/]")
+            console.print(HELP_COMMANDS)
+
+            # Additional helpful information
+            console.print("")
+            console.print("[italic]Run [bold]mcpm COMMAND -h[/] for more information on a command.[/]")
+
+
+# Register commands, imported on first use
+main.lazy_subcommands = {
+    "search": ("mcpm.commands.search", "search"),
+    "info": ("mcpm.commands.info", "info"),
+    "rm": ("mcpm.commands.server_operations.remove", "remove"),
+    "add": ("mcpm.commands.server_operations.add", "add"),
+    "ls": ("mcpm.commands.list", "list"),
+    "stash": ("mcpm.commands.server_operations.stash", "stash"),
+    "pop": ("mcpm.commands.server_operations.pop", "pop"),
+    "client": ("mcpm.commands.client", "client"),
+    "config": ("mcpm.commands.config", "config"),
+    "inspector": ("mcpm.commands.inspector", "inspector"),
+    "profile": ("mcpm.commands.profile", "profile"),
+    "mv": ("mcpm.commands.server_operations.transfer", "move"),
+    "cp": ("mcpm.commands.server_operations.transfer", "copy"),
+    "activate": ("mcpm.commands.profile", "activate"),
+    "deactivate": ("mcpm.commands.profile", "deactivate"),
+    "router": ("mcpm.commands.router", "router"),
+}
 
 if __name__ == "__main__":
     main()
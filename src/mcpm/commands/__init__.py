@@ -2,8 +2,30 @@
 MCPM commands package
 """
 
+import importlib
+
 __all__ = ["add", "client", "inspector", "list", "pop", "profile", "remove", "search", "stash", "transfer", "router"]
 
-# All command modules
-from . import client, inspector, list, profile, router, search
-from .server_operations import add, pop, remove, stash, transfer
+# All command modules, imported on first attribute access so that loading a
+# single command does not pull in every other one
+_COMMAND_MODULES = {
+    "client": "mcpm.commands.client",
+    "inspector": "mcpm.commands.inspector",
+    "list": "mcpm.commands.list",
+    "profile": "mcpm.commands.profile",
+    "router": "mcpm.commands.router",
+    "search": "mcpm.commands.search",
+    "add": "mcpm.commands.server_operations.add",
+    "pop": "mcpm.commands.server_operations.pop",
+    "remove": "mcpm.commands.server_operations.remove",
+    "stash": "mcpm.commands.server_operations.stash",
+    "transfer": "mcpm.commands.server_operations.transfer",
+}
+
+
+def __getattr__(name):
+    if name in _COMMAND_MODULES:
+        module = importlib.import_module(_COMMAND_MODULES[name])
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
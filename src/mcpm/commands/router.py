@@ -2,43 +2,81 @@
 Router command for managing the MCPRouter daemon process
 """
 
+import functools
 import logging
 import os
 import secrets
 import signal
 import subprocess
 import sys
-import uuid
 
 import click
-import psutil
 from rich.console import Console
-from rich.prompt import Confirm
 
 from mcpm.clients.client_registry import ClientRegistry
 from mcpm.router.share import Tunnel
-from mcpm.utils.config import ROUTER_SERVER_NAME, ConfigManager
+from mcpm.utils.config import DEFAULT_CONFIG_FILE, ROUTER_SERVER_NAME, ConfigManager
 from mcpm.utils.platform import get_log_directory, get_pid_directory
 
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 console = Console()
 
 APP_SUPPORT_DIR = get_pid_directory("mcpm")
-APP_SUPPORT_DIR.mkdir(parents=True, exist_ok=True)
 PID_FILE = APP_SUPPORT_DIR / "router.pid"
 SHARE_CONFIG = APP_SUPPORT_DIR / "share.json"
 
 LOG_DIR = get_log_directory("mcpm")
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_manager(config_path: str = DEFAULT_CONFIG_FILE) -> ConfigManager:
+    """return a config manager shared by all router commands in this process, so the config file is parsed once"""
+    return ConfigManager(config_path)
 
 
 def is_process_running(pid):
     """check if the process is running"""
+    # 0 and -1 address a process group or every process the user owns, never a single router
+    if pid <= 0:
+        return False
+
+    if sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+
+        PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+        STILL_ACTIVE = 259
+        ERROR_ACCESS_DENIED = 5
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        kernel32.OpenProcess.restype = wintypes.HANDLE
+        kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+        kernel32.GetExitCodeProcess.restype = wintypes.BOOL
+        kernel32.GetExitCodeProcess.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD)]
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+        if not handle:
+            # the process exists but we may not query it, e.g. it runs elevated
+            return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+        try:
+            exit_code = wintypes.DWORD()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+
+    # signal 0 only checks whether the process exists and can be signalled
     try:
-        return psutil.pid_exists(pid)
-    except Exception:
+        os.kill(pid, 0)
+    except ProcessLookupError:
         return False
+    except PermissionError:
+        # the process exists but belongs to another user
+        return True
+    except OSError:
+        return False
+    return True
 
 
 def read_pid_file():
@@ -59,9 +97,22 @@ def read_pid_file():
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_pid():
+    """read the pid file once per invocation, cleared whenever the pid file changes"""
+    return read_pid_file()
+
+
+def _ensure_pid_dir():
+    """create the pid directory, deferred until a pid file is actually written"""
+    APP_SUPPORT_DIR.mkdir(parents=True, exist_ok=True)
+
+
 def write_pid_file(pid):
     """write the process id to the pid file"""
+    _cached_pid.cache_clear()
     try:
+        _ensure_pid_dir()
         PID_FILE.write_text(str(pid))
         logger.debug(f"PID {pid} written to {PID_FILE}")
     except IOError as e:
@@ -71,12 +122,90 @@ def write_pid_file(pid):
 
 def remove_pid_file():
     """remove the pid file"""
+    _cached_pid.cache_clear()
     try:
         PID_FILE.unlink(missing_ok=True)
     except IOError as e:
         logger.error(f"Error removing PID file: {e}")
 
 
+def _can_fork():
+    """fork is used where it is safe to run the server without exec; macOS frameworks are not fork-safe"""
+    return hasattr(os, "fork") and sys.platform != "darwin"
+
+
+def _fork_router(host, port, log_file):
+    """run uvicorn in a forked child of this process, skipping a fresh interpreter start"""
+    import uvicorn
+
+    config = uvicorn.Config("mcpm.router.app:app", host=host, port=port, timeout_graceful_shutdown=5)
+
+    # flush pending output so the child does not write it a second time
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        return pid
+
+    # child: detach from the terminal session and redirect output to the log file
+    exit_code = 0
+    try:
+        os.setsid()
+        with open(os.devnull, "rb") as devnull:
+            os.dup2(devnull.fileno(), 0)
+        with open(log_file, "a") as log:
+            os.dup2(log.fileno(), 1)
+            os.dup2(log.fileno(), 2)
+        # release descriptors inherited from the caller, like Popen's close_fds, so pipes held
+        # by e.g. a CI runner or ssh session see EOF; uvicorn binds its socket only later in run()
+        try:
+            max_fd = os.sysconf("SC_OPEN_MAX")
+        except (ValueError, OSError):
+            max_fd = 256
+        os.closerange(3, max_fd if max_fd > 0 else 256)
+        # drop logging handlers inherited from the CLI, so the router app can set up its own log file
+        root_logger = logging.getLogger()
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        uvicorn.Server(config).run()
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        logger.exception("MCPRouter exited with an error")
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _spawn_router(host, port, log_file):
+    """run uvicorn in a new python interpreter"""
+    uvicorn_cmd = [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "mcpm.router.app:app",
+        "--host",
+        host,
+        "--port",
+        str(port),
+        "--timeout-graceful-shutdown",
+        "5",
+    ]
+
+    # open log file, prepare to redirect stdout and stderr
+    with open(log_file, "a") as log:
+        # use subprocess.Popen to start uvicorn
+        process = subprocess.Popen(
+            uvicorn_cmd,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,  # create new session, so the process won't be affected by terminal closing
+        )
+    return process.pid
+
+
 @click.group(name="router")
 @click.help_option("-h", "--help")
 def router():
@@ -95,49 +224,29 @@ def start_router():
         mcpm router on
     """
     # check if there is a router already running
-    existing_pid = read_pid_file()
+    existing_pid = _cached_pid()
     if existing_pid:
         console.print(f"[bold red]Error:[/] MCPRouter is already running (PID: {existing_pid})")
         console.print("Use 'mcpm router off' to stop the running instance.")
         return
 
     # get router config
-    config = ConfigManager().get_router_config()
+    config = _get_manager().get_router_config()
     host = config["host"]
     port = config["port"]
 
-    # prepare uvicorn command
-    uvicorn_cmd = [
-        sys.executable,
-        "-m",
-        "uvicorn",
-        "mcpm.router.app:app",
-        "--host",
-        host,
-        "--port",
-        str(port),
-        "--timeout-graceful-shutdown",
-        "5",
-    ]
-
     # start process
     try:
         # create log file
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
         log_file = LOG_DIR / "router_access.log"
 
-        # open log file, prepare to redirect stdout and stderr
-        with open(log_file, "a") as log:
-            # use subprocess.Popen to start uvicorn
-            process = subprocess.Popen(
-                uvicorn_cmd,
-                stdout=log,
-                stderr=log,
-                env=os.environ.copy(),
-                start_new_session=True,  # create new session, so the process won't be affected by terminal closing
-            )
+        if _can_fork():
+            pid = _fork_router(host, port, log_file)
+        else:
+            pid = _spawn_router(host, port, log_file)
 
         # record PID
-        pid = process.pid
         write_pid_file(pid)
 
         console.print(f"[bold green]MCPRouter started[/] at http://{host}:{port} (PID: {pid})")
@@ -167,23 +276,27 @@ def set_router_config(host, port, address):
         return
 
     # get current config, make sure all field are filled by default value if not exists
-    config_manager = ConfigManager()
-    current_config = config_manager.get_router_config()
+    config_manager = _get_manager()
+    # filling in defaults and saving the new values are written to disk once
+    with config_manager.batch() as batch:
+        current_config = config_manager.get_router_config()
+
+        # if user does not specify a host, use current config
+        host = host or current_config["host"]
+        port = port or current_config["port"]
+        share_address = address or current_config["share_address"]
 
-    # if user does not specify a host, use current config
-    host = host or current_config["host"]
-    port = port or current_config["port"]
-    share_address = address or current_config["share_address"]
+        # save config
+        saved = config_manager.save_router_config(host, port, share_address)
 
-    # save config
-    if config_manager.save_router_config(host, port, share_address):
+    if saved and batch.ok:
         console.print(
             f"[bold green]Router configuration updated:[/] host={host}, port={port}, share_address={share_address}"
         )
         console.print("The new configuration will be used next time you start the router.")
 
         # if router is running, prompt user to restart
-        pid = read_pid_file()
+        pid = _cached_pid()
         if pid:
             console.print("[yellow]Note: Router is currently running. Restart it to apply new settings:[/]")
             console.print("    mcpm router off")
@@ -192,6 +305,8 @@ def set_router_config(host, port, address):
         console.print("[bold red]Error:[/] Failed to save router configuration.")
         return
 
+    from rich.prompt import Confirm
+
     if Confirm.ask("Do you want to update router for all clients now?"):
         active_profile = ClientRegistry.get_active_profile()
         if not active_profile:
@@ -226,14 +341,14 @@ def stop_router():
         mcpm router off
     """
     # check if there is a router already running
-    pid = read_pid_file()
+    pid = _cached_pid()
     if not pid:
         console.print("[yellow]MCPRouter is not running.[/]")
         return
 
     # send termination signal
     try:
-        config_manager = ConfigManager()
+        config_manager = _get_manager()
         share_config = config_manager.read_share_config()
         if share_config.get("pid"):
             console.print("[green]Disabling share link...[/]")
@@ -265,16 +380,17 @@ def router_status():
     \b
         mcpm router status
     """
-    # get router config
-    config = ConfigManager().get_router_config()
+    # router and share settings live in the same config file, read both from one manager
+    config_manager = _get_manager()
+    config = config_manager.get_router_config()
     host = config["host"]
     port = config["port"]
 
     # check process status
-    pid = read_pid_file()
+    pid = _cached_pid()
     if pid:
         console.print(f"[bold green]MCPRouter is running[/] at http://{host}:{port} (PID: {pid})")
-        share_config = ConfigManager().read_share_config()
+        share_config = config_manager.read_share_config()
         if share_config.get("pid"):
             console.print(f"[bold green]MCPRouter is sharing[/] at {share_config['url']} (PID: {share_config['pid']})")
     else:
@@ -295,8 +411,8 @@ def share(address, profile):
     """
 
     # check if there is a router already running
-    pid = read_pid_file()
-    config_manager = ConfigManager()
+    pid = _cached_pid()
+    config_manager = _get_manager()
     if not pid:
         console.print("[yellow]MCPRouter is not running.[/]")
         return
@@ -332,7 +448,7 @@ def share(address, profile):
     share_url = tunnel.start_tunnel()
     share_pid = tunnel.proc.pid if tunnel.proc else None
     # generate random api key
-    api_key = str(uuid.uuid4())
+    api_key = secrets.token_hex(16)
     console.print(f"[bold green]Generated secret for share link: {api_key}[/]")
     # TODO: https is not supported yet
     share_url = share_url.replace("https://", "http://") + "/sse"
@@ -353,7 +469,7 @@ def share(address, profile):
 def stop_share():
     """Stop the share link for the MCPRouter daemon process."""
     # check if there is a share link already running
-    config_manager = ConfigManager()
+    config_manager = _get_manager()
     share_config = config_manager.read_share_config()
     if not share_config["url"]:
         console.print("[yellow]No share link is active.[/]")
@@ -2,10 +2,33 @@
 Configuration utilities for MCPM
 """
 
+import copy
 import json
 import logging
 import os
-from typing import Any, Dict
+import shutil
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+try:
+    import orjson
+
+    def _loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is optional, fall back to the standard library
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +47,13 @@ PROMPT_SPLITOR = "_p_"
 DEFAULT_SHARE_ADDRESS = f"share.mcpm.sh:{DEFAULT_PORT}"
 
 
+class ConfigBatch:
+    """Outcome of a ConfigManager.batch block, ok is False if its deferred write failed"""
+
+    def __init__(self):
+        self.ok = True
+
+
 class ConfigManager:
     """Manages MCP basic configuration
 
@@ -35,6 +65,8 @@ class ConfigManager:
         self.config_path = config_path
         self.config_dir = os.path.dirname(config_path)
         self._config = None
+        self._batch = None
+        self._dirty = False
         self._ensure_dirs()
         self._load_config()
 
@@ -46,9 +78,8 @@ class ConfigManager:
         """Load configuration from file or create default"""
         if os.path.exists(self.config_path):
             try:
-                with open(self.config_path, "r") as f:
-                    self._config = json.load(f)
-            except json.JSONDecodeError:
+                self._config = _loads(Path(self.config_path).read_bytes())
+            except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
                 logger.error(f"Error parsing config file: {self.config_path}")
                 self._config = self._default_config()
         else:
@@ -61,9 +92,59 @@ class ConfigManager:
         return {}
 
     def _save_config(self) -> None:
-        """Save current configuration to file"""
-        with open(self.config_path, "w") as f:
-            json.dump(self._config, f, indent=2)
+        """Save current configuration to file
+
+        The file is written to a temporary sibling and moved into place, so an
+        interrupted write never leaves a truncated config behind. A symlinked
+        config is followed and the existing file mode is kept.
+        """
+        target = os.path.realpath(self.config_path)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".config-", suffix=".json")
+        try:
+            try:
+                f = os.fdopen(fd, "wb")
+            except BaseException:
+                os.close(fd)
+                raise
+            with f:
+                f.write(_dumps(self._config))
+            if os.path.exists(target):
+                shutil.copymode(target, tmp_path)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def batch(self) -> Iterator[ConfigBatch]:
+        """Defer set_config writes until the block exits, persisting all changes in one write
+
+        The yielded ConfigBatch reports whether that write succeeded. If the block
+        raises, its changes are discarded and nothing is written.
+        """
+        if self._batch is not None:
+            # Nested batch, the outermost one writes
+            yield self._batch
+            return
+        snapshot = copy.deepcopy(self._config)
+        batch = self._batch = ConfigBatch()
+        try:
+            yield batch
+        except BaseException:
+            # Discard the block's changes in place, other holders keep a reference to this dict
+            self._config.clear()
+            self._config.update(snapshot)
+            self._dirty = False
+            raise
+        finally:
+            self._batch = None
+        if self._dirty:
+            self._dirty = False
+            try:
+                self._save_config()
+            except Exception as e:
+                logger.error(f"Error saving configuration: {str(e)}")
+                batch.ok = False
 
     def get_config(self) -> Dict[str, Any]:
         """Get the complete configuration"""
@@ -87,8 +168,11 @@ class ConfigManager:
                 # Set the key to the provided value
                 self._config[key] = value
 
-            # Save the updated configuration
-            self._save_config()
+            # Save the updated configuration, unless a batch will save it on exit
+            if self._batch is not None:
+                self._dirty = True
+            else:
+                self._save_config()
             return True
         except Exception as e:
             logger.error(f"Error setting configuration {key}: {str(e)}")
@@ -1,6 +1,9 @@
+import subprocess
+import sys
 from collections import deque
+from unittest.mock import Mock
 
-from click import Group
+from click import Context, Group
 from click.testing import CliRunner
 
 from mcpm.cli import main
@@ -15,7 +18,9 @@ def test_cli_help():
         commands = []
         while queue:
             cmd = queue.popleft()
-            sub_cmds = cmd.commands.values()
+            # resolve through the group API so lazily registered subcommands are included
+            ctx = Context(cmd)
+            sub_cmds = [cmd.get_command(ctx, name) for name in cmd.list_commands(ctx)]
             for sub_cmd in sub_cmds:
                 commands.append(sub_cmd)
                 if isinstance(sub_cmd, Group):
@@ -32,3 +37,34 @@ def test_cli_help():
         result = runner.invoke(cmd, ["-h"])
         assert result.exit_code == 0
         assert "Usage:" in result.output
+
+
+def test_client_free_commands_skip_active_client_check(monkeypatch):
+    """Commands that need no active client should not load the client config."""
+    client_config_manager = Mock(side_effect=AssertionError("client config should not be loaded"))
+    monkeypatch.setattr("mcpm.cli._client_config_manager", client_config_manager)
+
+    runner = CliRunner()
+    for command in ["client", "config", "search", "router"]:
+        result = runner.invoke(main, [command, "-h"])
+        assert result.exit_code == 0
+        assert "Usage:" in result.output
+    client_config_manager.assert_not_called()
+
+
+def test_fast_version_flag():
+    """--version is answered by the entry point shim without importing click, rich or the CLI."""
+    from mcpm import __version__
+
+    script = (
+        "import sys\n"
+        "sys.argv = ['mcpm', sys.argv[1]]\n"
+        "from mcpm._fastcli import main\n"
+        "assert main() == 0\n"
+        "loaded = {'click', 'rich', 'mcpm.cli'} & sys.modules.keys()\n"
+        "assert not loaded, loaded\n"
+    )
+    for flag in ["-v", "--version"]:
+        result = subprocess.run([sys.executable, "-c", script, flag], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == __version__
@@ -0,0 +1,110 @@
+"""
+Tests for the basic configuration manager
+"""
+
+import json
+import os
+import stat
+import tempfile
+from unittest.mock import patch
+
+import pytest
+
+from mcpm.utils.config import DEFAULT_HOST, DEFAULT_PORT, DEFAULT_SHARE_ADDRESS, ConfigManager
+
+
+def test_batch_defers_writes_until_exit():
+    """Test that set_config inside a batch is persisted once on exit"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_path=config_path)
+
+        with patch.object(config_manager, "_save_config", wraps=config_manager._save_config) as save:
+            with config_manager.batch():
+                config_manager.get_router_config()
+                assert config_manager.save_router_config("127.0.0.1", 9000, DEFAULT_SHARE_ADDRESS)
+                config_manager.set_config("active_client", "windsurf")
+                assert save.call_count == 0
+            assert save.call_count == 1
+
+        with open(config_path) as f:
+            saved = json.load(f)
+        assert saved["router"] == {"host": "127.0.0.1", "port": 9000, "share_address": DEFAULT_SHARE_ADDRESS}
+        assert saved["active_client"] == "windsurf"
+
+
+def test_batch_without_changes_does_not_write():
+    """Test that a batch with no changes leaves the file untouched"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_path=config_path)
+        config_manager.get_router_config()
+
+        with patch.object(config_manager, "_save_config") as save:
+            with config_manager.batch():
+                router_config = config_manager.get_router_config()
+            save.assert_not_called()
+
+        assert router_config["host"] == DEFAULT_HOST
+        assert router_config["port"] == DEFAULT_PORT
+
+
+def test_save_config_replaces_file_atomically():
+    """Test that saving round-trips the config and leaves no temporary files behind"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_path=config_path)
+        config_manager.save_share_config("http://share.example.com/sse", 1234, "secret")
+
+        assert os.listdir(temp_dir) == ["config.json"]
+        reloaded = ConfigManager(config_path=config_path)
+        assert reloaded.read_share_config() == {"url": "http://share.example.com/sse", "pid": 1234, "api_key": "secret"}
+
+
+def test_batch_reports_failed_write():
+    """Test that a failing deferred write is logged and reported instead of raised"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_path=config_path)
+
+        with patch.object(config_manager, "_save_config", side_effect=OSError("disk full")):
+            with config_manager.batch() as batch:
+                assert config_manager.save_router_config("127.0.0.1", 9000, DEFAULT_SHARE_ADDRESS)
+        assert not batch.ok
+
+
+def test_batch_discards_changes_when_block_raises():
+    """Test that nothing is written and changes are dropped if the block raises"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_path = os.path.join(temp_dir, "config.json")
+        config_manager = ConfigManager(config_path=config_path)
+
+        with patch.object(config_manager, "_save_config") as save:
+            with pytest.raises(RuntimeError):
+                with config_manager.batch():
+                    config_manager.set_config("active_client", "windsurf")
+                    raise RuntimeError("boom")
+            save.assert_not_called()
+        assert "active_client" not in config_manager.get_config()
+
+
+def test_save_config_keeps_symlink_and_mode():
+    """Test that saving writes through a symlinked config and keeps the file mode"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        real_path = os.path.join(temp_dir, "dotfiles", "config.json")
+        os.makedirs(os.path.dirname(real_path))
+        with open(real_path, "w") as f:
+            json.dump({}, f)
+        os.chmod(real_path, 0o644)
+        config_path = os.path.join(temp_dir, "mcpm", "config.json")
+        os.makedirs(os.path.dirname(config_path))
+        os.symlink(real_path, config_path)
+
+        config_manager = ConfigManager(config_path=config_path)
+        config_manager.set_config("active_client", "windsurf")
+
+        assert os.path.islink(config_path)
+        assert stat.S_IMODE(os.stat(real_path).st_mode) == 0o644
+        with open(real_path) as f:
+            assert json.load(f) == {"active_client": "windsurf"}
+        assert sorted(os.listdir(os.path.dirname(real_path))) == ["config.json"]
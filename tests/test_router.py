@@ -0,0 +1,77 @@
+"""
+Tests for the router commands
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+import mcpm.commands.router as router_commands
+from mcpm.commands.router import is_process_running
+from mcpm.utils.config import ConfigManager
+
+
+def test_is_process_running():
+    """Test that live pids are detected and process group pids are rejected"""
+    assert is_process_running(os.getpid())
+    # 0 and -1 would signal a whole process group or every process of the user
+    assert not is_process_running(0)
+    assert not is_process_running(-1)
+
+
+@pytest.fixture
+def router_env(tmp_path, monkeypatch):
+    """Point the router commands at temporary pid, log and config locations"""
+    monkeypatch.setattr(router_commands, "APP_SUPPORT_DIR", tmp_path / "pid")
+    monkeypatch.setattr(router_commands, "PID_FILE", tmp_path / "pid" / "router.pid")
+    monkeypatch.setattr(router_commands, "LOG_DIR", tmp_path / "logs")
+    config_manager = ConfigManager(config_path=str(tmp_path / "config" / "config.json"))
+    monkeypatch.setattr(router_commands, "_get_manager", lambda: config_manager)
+    # report the fake router pids as alive
+    monkeypatch.setattr(router_commands, "is_process_running", lambda pid: pid > 0)
+    router_commands._cached_pid.cache_clear()
+    yield tmp_path
+    router_commands._cached_pid.cache_clear()
+
+
+def test_start_router_forks(router_env, monkeypatch):
+    """Test that the router is forked in-process where fork is available"""
+    uvicorn = Mock()
+    monkeypatch.setitem(sys.modules, "uvicorn", uvicorn)
+    monkeypatch.setattr(router_commands, "_can_fork", lambda: True)
+    fork = Mock(return_value=4242)
+    monkeypatch.setattr(os, "fork", fork, raising=False)
+    popen = Mock()
+    monkeypatch.setattr(router_commands.subprocess, "Popen", popen)
+
+    result = CliRunner().invoke(router_commands.router, ["on"])
+
+    assert result.exit_code == 0
+    assert "PID: 4242" in result.output
+    fork.assert_called_once()
+    popen.assert_not_called()
+    uvicorn.Config.assert_called_once()
+    # the parent only records the child, the server runs in the child
+    uvicorn.Server.assert_not_called()
+    assert router_commands.PID_FILE.read_text() == "4242"
+
+
+def test_start_router_spawns_without_fork(router_env, monkeypatch):
+    """Test that a new interpreter is spawned where fork is not used"""
+    monkeypatch.setattr(router_commands, "_can_fork", lambda: False)
+    fork = Mock()
+    monkeypatch.setattr(os, "fork", fork, raising=False)
+    popen = Mock(return_value=Mock(pid=4343))
+    monkeypatch.setattr(router_commands.subprocess, "Popen", popen)
+
+    result = CliRunner().invoke(router_commands.router, ["on"])
+
+    assert result.exit_code == 0
+    assert "PID: 4343" in result.output
+    fork.assert_not_called()
+    popen.assert_called_once()
+    assert popen.call_args.args[0][1:4] == ["-m", "uvicorn", "mcpm.router.app:app"]
+    assert router_commands.PID_FILE.read_text() == "4343"